@@ -1,50 +1,145 @@
 import pandas as pd
-from datetime import datetime, timedelta
 import numpy as np
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from math import ceil, expm1, log, log1p
+import os
+
+# numba is optional; compiled XIRR kernels are cached across runs in a per-user directory
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "AdvanceSIP", "numba"))
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Excel reports are written off the calling thread, one at a time
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# xlsxwriter serializes much faster than openpyxl; use it when installed
+_EXCEL_ENGINE = "xlsxwriter" if find_spec("xlsxwriter") else "openpyxl"
 
 
 # ═══════════════════════════════════════════════════════════════════
 # HELPER FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════
 
+def FloatMidpoint(Low, High):
+    # Bisect the float64 bit patterns rather than the values, so any bracket
+    # collapses to adjacent floats in at most ~64 steps
+    def ToOrdered(Value):
+        Bits = struct.unpack("<q", struct.pack("<d", Value))[0]
+        return Bits if Bits >= 0 else -(Bits & 0x7FFFFFFFFFFFFFFF)
+
+    def FromOrdered(Ordered):
+        Bits = Ordered if Ordered >= 0 else -Ordered | 0x8000000000000000
+        return struct.unpack("<d", struct.pack("<Q", Bits))[0]
+
+    return FromOrdered((ToOrdered(Low) + ToOrdered(High)) // 2)
+
+
+def _Jit(Signature):
+    # Compile eagerly with numba when it is installed, otherwise run as plain Python
+    if njit is None:
+        return lambda Function: Function
+    return njit(Signature, cache=True, fastmath=True, boundscheck=False)
+
+
+if njit is not None:
+    @_Jit("float64(float64[:], float64[:], float64)")
+    def _NetPresentValue(Cashflows, Times, Rate):
+        Npv = 0.0
+        for i in range(Cashflows.shape[0]):
+            Npv += Cashflows[i] * (1 + Rate) ** (-Times[i])
+        return Npv
+
+    @_Jit("UniTuple(float64, 2)(float64[:], float64[:], float64)")
+    def _NpvAndDerivative(Cashflows, Times, Rate):
+        # One pow per cashflow: d/dRate of cf * (1+Rate)^-t is -t * that term / (1+Rate)
+        Npv = 0.0
+        Derivative = 0.0
+        for i in range(Cashflows.shape[0]):
+            Discounted = Cashflows[i] * (1 + Rate) ** (-Times[i])
+            Npv += Discounted
+            Derivative -= Times[i] * Discounted
+        return Npv, Derivative / (1 + Rate)
+else:
+    def _NetPresentValue(Cashflows, Times, Rate):
+        return np.dot(Cashflows, (1 + Rate) ** -Times)
+
+    def _NpvAndDerivative(Cashflows, Times, Rate):
+        Discounted = Cashflows * (1 + Rate) ** -Times
+        return Discounted.sum(), -np.dot(Times, Discounted) / (1 + Rate)
+
+
+@_Jit("float64(float64[:], float64[:], float64, int64, float64)")
+def _XirrKernel(Cashflows, Times, Guess, MaxIterations, Precision):
+    # Newton's method with the analytic derivative; NaN means no convergence
+    Rate = max(-0.99, min(Guess, 5.0))
+    for _ in range(MaxIterations):
+        Npv, Derivative = _NpvAndDerivative(Cashflows, Times, Rate)
+        if abs(Npv) < Precision:
+            return Rate
+
+        if abs(Derivative) < 1e-10:
+            break
+        Rate -= Npv / Derivative
+        if Rate <= -1:
+            break
+    return np.nan
+
+
 def CalculateReturns(Cashflows, Dates, MaxIterations=200, Precision=1e-6):
     if len(Cashflows) != len(Dates):
         raise ValueError("Number of cashflows must match number of dates")
 
-    TotalInvested = sum(cf for cf in Cashflows if cf < 0)
-    FinalValue = sum(cf for cf in Cashflows if cf > 0)
+    Times = np.array([(d - Dates[0]).days for d in Dates], dtype=np.float64) / 365.25
+    return _CalculateReturnsFromTimes(Cashflows, Times, MaxIterations, Precision)
+
+
+def _CalculateReturnsFromTimes(Cashflows, Times, MaxIterations=200, Precision=1e-6):
+    # Same as CalculateReturns, with cashflow times already in years from the first one
+    Cashflows = np.asarray(Cashflows, dtype=np.float64)
+    Times = np.asarray(Times, dtype=np.float64)
+
+    TotalInvested = Cashflows[Cashflows < 0].sum()
+    FinalValue = Cashflows[Cashflows > 0].sum()
     
     if TotalInvested == 0 or FinalValue == 0:
         return 0.0
 
-    Years = (Dates[-1] - Dates[0]).days / 365.25
-    InitialGuess = (FinalValue / abs(TotalInvested)) ** (1 / Years) - 1 if Years > 0 else 0.1
-
-    def CalculateNetPresentValue(Rate):
-        return sum(
-            cf / ((1 + Rate) ** ((d - Dates[0]).days / 365.25))
-            for cf, d in zip(Cashflows, Dates)
-        )
-
-    Rate = max(-0.99, min(InitialGuess, 5.0))
-    for _ in range(MaxIterations):
-        Npv = CalculateNetPresentValue(Rate)
-        if abs(Npv) < Precision:
-            return Rate * 100
-        
-        Derivative = (CalculateNetPresentValue(Rate + 1e-6) - Npv) / 1e-6
-        if abs(Derivative) < 1e-10:
-            break
-        Rate -= Npv / Derivative
+    Years = Times[-1]
+    GrowthMultiple = FinalValue / abs(TotalInvested)
+    InitialGuess = expm1(log(GrowthMultiple) / Years) if Years > 0 else 0.1
+
+    # When the last cashflow is the only inflow (the SIP case), every outflow grows to
+    # it, and since (1 + r) ** t is convex in t each one's growth lies below the chord
+    # over [0, Years]: GrowthMultiple <= 1 + ((1 + r) ** Years - 1) * HoldingPeriod / Years,
+    # with HoldingPeriod the money-weighted time invested. Solving that for r gives a
+    # lower bound much closer to the root than the full-span guess, and Newton
+    # converges safely from below. Other cashflow patterns keep the full-span guess
+    Invested = Cashflows < 0
+    OnlyFinalInflow = Cashflows[-1] > 0 and not (Cashflows[:-1] > 0).any()
+    HoldingPeriod = np.dot(-Cashflows[Invested], Years - Times[Invested]) / abs(TotalInvested)
+    if OnlyFinalInflow and GrowthMultiple > 1 and HoldingPeriod > 0:
+        InitialGuess = expm1(log1p((GrowthMultiple - 1) * Years / HoldingPeriod) / Years)
+
+    Rate = _XirrKernel(Cashflows, Times, InitialGuess, MaxIterations, Precision)
+    if not np.isnan(Rate):
+        return Rate * 100
 
     Low, High = -0.99, 5.0
+    LowNpv = _NetPresentValue(Cashflows, Times, Low)
     for _ in range(MaxIterations):
-        Mid = (Low + High) / 2
-        MidNpv = CalculateNetPresentValue(Mid)
+        Mid = FloatMidpoint(Low, High)
+        if Mid == Low or Mid == High:
+            break
+        MidNpv = _NetPresentValue(Cashflows, Times, Mid)
         if abs(MidNpv) < Precision:
             return Mid * 100
-        if MidNpv * CalculateNetPresentValue(Low) > 0:
-            Low = Mid
+        if MidNpv * LowNpv > 0:
+            Low, LowNpv = Mid, MidNpv
         else:
             High = Mid
     
@@ -52,68 +147,93 @@ def CalculateReturns(Cashflows, Dates, MaxIterations=200, Precision=1e-6):
 
 
 def CalculateInflationAdjustedReturns(Cashflows, Dates, InflationRate):
-    AdjustedCashflows = []
-    StartDate = Dates[0]
-    
-    for cf, d in zip(Cashflows, Dates):
-        Years = (d - StartDate).days / 365.25
-        # For outflows (negative cf): we pay more in future rupees → inflate the outflow
-        # For inflows (positive cf): future money worth less today → deflate the inflow
-        if cf < 0:
-            adjusted_cf = cf * (1 + InflationRate) ** Years     # outflow becomes larger in today's terms
-        else:
-            adjusted_cf = cf / (1 + InflationRate) ** Years     # inflow becomes smaller in today's terms
-        AdjustedCashflows.append(adjusted_cf)
-    
-    return CalculateReturns(AdjustedCashflows, Dates)  # now solves for real rate
+    if len(Cashflows) != len(Dates):
+        raise ValueError("Number of cashflows must match number of dates")
 
+    Times = np.array([(d - Dates[0]).days for d in Dates], dtype=np.float64) / 365.25
+    return _CalculateInflationAdjustedReturnsFromTimes(Cashflows, Times, InflationRate)
 
-def CalculateFutureValue(
-    MonthlyAmount, YearlyReturnPercent, InvestmentYears,
-    YearlyIncreasePercent, FundExpensePercent, TaxImpactPercent,
-    StartingLumpsum=0.0
+
+def _CalculateInflationAdjustedReturnsFromTimes(Cashflows, Times, InflationRate):
+    Cashflows = np.asarray(Cashflows, dtype=np.float64)
+    InflationFactor = np.power(1 + InflationRate, Times)
+
+    # For outflows (negative cf): we pay more in future rupees → inflate the outflow
+    # For inflows (positive cf): future money worth less today → deflate the inflow
+    AdjustedCashflows = np.where(Cashflows < 0, Cashflows * InflationFactor, Cashflows / InflationFactor)
+
+    return _CalculateReturnsFromTimes(AdjustedCashflows, Times)  # now solves for real rate
+
+
+def _MakeFutureValueEvaluator(
+    YearlyReturnPercent, YearlyIncreasePercent, FundExpensePercent,
+    TaxImpactPercent, StartingLumpsum=0.0, MaxYears=80
 ):
+    # Everything except the SIP amount and horizon is fixed, so the monthly
+    # growth and yearly step-up powers are tabulated once for up to MaxYears
     NetReturn = YearlyReturnPercent - FundExpensePercent - TaxImpactPercent
     if NetReturn <= 0:
-        return 0.0
-    
+        return lambda MonthlyAmount, InvestmentYears: 0.0
+
     AnnualRate = NetReturn / 100
-    MonthlyRate = (1 + AnnualRate) ** (1 / 12) - 1
-    TotalMonths = int(InvestmentYears * 12)
-    
-    if TotalMonths == 0:
-        return StartingLumpsum
+    MonthlyRate = expm1(log1p(AnnualRate) / 12)
+    MaxMonths = int(MaxYears * 12)
+    PowTable = np.power(1 + MonthlyRate, np.arange(MaxMonths + 1))
+    YearIndexTable = np.arange(-(-MaxMonths // 12))
+    StepUpTable = np.power(1 + YearlyIncreasePercent / 100, YearIndexTable)
+
+    def FutureValue(MonthlyAmount, InvestmentYears):
+        TotalMonths = int(InvestmentYears * 12)
+        if TotalMonths == 0:
+            return StartingLumpsum
+
+        # SIP is constant within a year, so each year is a closed-form annuity
+        # compounded over the months left after that year's last instalment
+        NumYears = -(-TotalMonths // 12)
+        YearIndex = YearIndexTable[:NumYears]
+        MonthsInYear = np.minimum(12, TotalMonths - 12 * YearIndex)
+        YearlyValue = (
+            StepUpTable[:NumYears] * (PowTable[MonthsInYear] - 1) / MonthlyRate
+            * PowTable[TotalMonths - 12 * YearIndex - MonthsInYear + 1]
+        )
 
-    FutureValue = StartingLumpsum * (1 + MonthlyRate) ** TotalMonths
-    MonthlySip = MonthlyAmount
-    
-    for Month in range(TotalMonths):
-        MonthsRemaining = TotalMonths - Month
-        FutureValue += MonthlySip * (1 + MonthlyRate) ** MonthsRemaining
-        
-        if (Month + 1) % 12 == 0 and Month < TotalMonths - 1:
-            MonthlySip *= (1 + YearlyIncreasePercent / 100)
+        return float(StartingLumpsum * PowTable[TotalMonths] + MonthlyAmount * YearlyValue.sum())
 
     return FutureValue
 
 
+def CalculateFutureValue(
+    MonthlyAmount, YearlyReturnPercent, InvestmentYears,
+    YearlyIncreasePercent, FundExpensePercent, TaxImpactPercent,
+    StartingLumpsum=0.0
+):
+    FutureValue = _MakeFutureValueEvaluator(
+        YearlyReturnPercent, YearlyIncreasePercent, FundExpensePercent,
+        TaxImpactPercent, StartingLumpsum, MaxYears=InvestmentYears
+    )
+    return FutureValue(MonthlyAmount, InvestmentYears)
+
+
 def FindRequiredMonthlySip(
     TargetAmount, YearlyReturnPercent, InvestmentYears,
     YearlyIncreasePercent, FundExpensePercent, TaxImpactPercent,
     StartingLumpsum=0.0
 ):
-    Low, High = 0, TargetAmount * 2
-    for _ in range(100):
-        Mid = (Low + High) / 2
-        if CalculateFutureValue(
-            Mid, YearlyReturnPercent, InvestmentYears,
-            YearlyIncreasePercent, FundExpensePercent, TaxImpactPercent,
-            StartingLumpsum
-        ) < TargetAmount:
-            Low = Mid
-        else:
-            High = Mid
-    return round(Mid, 0)
+    # Future value is linear in the SIP amount, so solve for it directly
+    LumpsumValue = CalculateFutureValue(
+        0.0, YearlyReturnPercent, InvestmentYears,
+        YearlyIncreasePercent, FundExpensePercent, TaxImpactPercent,
+        StartingLumpsum
+    )
+    UnitSipValue = CalculateFutureValue(
+        1.0, YearlyReturnPercent, InvestmentYears,
+        YearlyIncreasePercent, FundExpensePercent, TaxImpactPercent
+    )
+    if UnitSipValue <= 0:
+        raise ValueError("Target cannot be reached: net return and investment period must be positive")
+
+    RequiredSip = (TargetAmount - LumpsumValue) / UnitSipValue
+    return round(max(RequiredSip, 0.0), 0)
 
 
 def FindRequiredYears(
@@ -121,18 +241,27 @@ def FindRequiredYears(
     YearlyIncreasePercent, FundExpensePercent, TaxImpactPercent,
     StartingLumpsum=0.0
 ):
-    Low, High = 0.1, 80
+    Low, High = 0.1, 80.0
+    FutureValue = _MakeFutureValueEvaluator(
+        YearlyReturnPercent, YearlyIncreasePercent, FundExpensePercent,
+        TaxImpactPercent, StartingLumpsum, MaxYears=High
+    )
+    # The bisection below assumes the target is not met at the lower bound
+    if FutureValue(MonthlyAmount, Low) >= TargetAmount:
+        return Low
+
     for _ in range(100):
-        Mid = (Low + High) / 2
-        if CalculateFutureValue(
-            MonthlyAmount, YearlyReturnPercent, Mid,
-            YearlyIncreasePercent, FundExpensePercent, TaxImpactPercent,
-            StartingLumpsum
-        ) < TargetAmount:
+        Mid = FloatMidpoint(Low, High)
+        if Mid == Low or Mid == High:
+            break
+        if FutureValue(MonthlyAmount, Mid) < TargetAmount:
             Low = Mid
         else:
             High = Mid
-    return round(Mid, 1)
+
+    # High is the shortest horizon that reaches the target; round up so the
+    # reported tenth of a year still reaches it
+    return ceil(High * 10) / 10
 
 
 def SimulateRetirementWithdrawals(
@@ -144,29 +273,40 @@ def SimulateRetirementWithdrawals(
     InvestmentReturn = ReturnAfterRetirementPercent / 100
 
     FirstYearWithdrawal = RetirementCorpus * WithdrawalRate
-    RemainingCorpus = RetirementCorpus
-    YearlyData = []
-    YearsMoneyLasts = 0
-
-    for Year in range(1, MaxYears + 1):
-        AnnualWithdrawal = FirstYearWithdrawal * (1 + Inflation) ** (Year - 1)
-        CorpusStart = RemainingCorpus
-        RemainingCorpus = RemainingCorpus * (1 + InvestmentReturn) - AnnualWithdrawal
-        
-        YearlyData.append({
-            "Year": Year,
-            "Withdrawal Amount": round(AnnualWithdrawal, 0),
-            "Corpus at Year Start": round(CorpusStart, 0),
-            "Corpus at Year End": round(max(RemainingCorpus, 0), 0),
-            "Withdrawal as % of Corpus": round((AnnualWithdrawal / CorpusStart * 100), 2) if CorpusStart > 0 else 0,
-        })
-        
-        if RemainingCorpus > 0:
-            YearsMoneyLasts = Year
-        else:
-            break
-
-    return pd.DataFrame(YearlyData), YearsMoneyLasts
+    Years = np.arange(1, MaxYears + 1)
+    ReturnGrowth = (1 + InvestmentReturn) ** Years
+    InflationGrowth = (1 + Inflation) ** Years
+
+    # Closed form of Corpus[t] = Corpus[t - 1] * (1 + r) - FirstYearWithdrawal * (1 + i) ** (t - 1).
+    # ((1 + r)^t - (1 + i)^t) / (r - i) is taken as (1 + i)^t * expm1(t * log1p((r - i) / (1 + i))) / (r - i)
+    # so nearly equal rates don't cancel
+    RateGap = InvestmentReturn - Inflation
+    if RateGap == 0:
+        WithdrawnValue = FirstYearWithdrawal * Years * ReturnGrowth / (1 + InvestmentReturn)
+    else:
+        WithdrawnValue = FirstYearWithdrawal * InflationGrowth * np.expm1(Years * log1p(RateGap / (1 + Inflation))) / RateGap
+    CorpusEnd = RetirementCorpus * ReturnGrowth - WithdrawnValue
+
+    # Keep every year up to and including the one that empties the corpus,
+    # and only derive the report columns for those years
+    Depleted = CorpusEnd <= 0
+    YearsMoneyLasts = int(np.argmax(Depleted)) if Depleted.any() else MaxYears
+    Rows = min(YearsMoneyLasts + 1, MaxYears)
+    Years, CorpusEnd = Years[:Rows], CorpusEnd[:Rows]
+
+    CorpusStart = np.concatenate(([RetirementCorpus], CorpusEnd[:-1]))[:Rows]
+    Withdrawals = FirstYearWithdrawal * InflationGrowth[:Rows] / (1 + Inflation)
+    WithdrawalPercent = np.divide(Withdrawals, CorpusStart, out=np.zeros(Rows), where=CorpusStart > 0) * 100
+
+    YearlyData = pd.DataFrame({
+        "Year": Years,
+        "Withdrawal Amount": np.round(Withdrawals).astype(np.int64),
+        "Corpus at Year Start": np.round(CorpusStart).astype(np.int64),
+        "Corpus at Year End": np.round(np.maximum(CorpusEnd, 0)).astype(np.int64),
+        "Withdrawal as % of Corpus": np.round(WithdrawalPercent, 2),
+    })
+
+    return YearlyData, YearsMoneyLasts
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -185,7 +325,8 @@ def RunSipCalculation(
     WithdrawalRateInRetirement,
     ReturnAfterRetirement,
     OutputFile,
-    ModeTitle="SIP CALCULATOR RESULTS"
+    ModeTitle="SIP CALCULATOR RESULTS",
+    WaitForExcel=True
 ):
     if InvestmentYears <= 0:
         raise ValueError("Investment period must be positive")
@@ -207,156 +348,146 @@ def RunSipCalculation(
         print(f"⚠️  WARNING: {FundExpenseRatio}% expense ratio is high.")
 
     YearlyReturn = NetReturn / 100
-    MonthlyReturn = (1 + YearlyReturn) ** (1 / 12) - 1
+    MonthlyReturn = expm1(log1p(YearlyReturn) / 12)
     InflationMultiplier = InflationRate / 100
     StepUpMultiplier = YearlyStepUp / 100
     TotalMonths = int(InvestmentYears * 12)
 
-    # Final Corpus
-    FinalCorpus = StartingLumpsum * (1 + MonthlyReturn) ** TotalMonths if TotalMonths > 0 else StartingLumpsum
-    TotalAmountInvested = StartingLumpsum
-    TotalStepUpAmount = 0.0
-    MonthlySip = MonthlyInvestment
-
-    for Month in range(TotalMonths):
-        MonthsRemaining = TotalMonths - Month
-        FinalCorpus += MonthlySip * (1 + MonthlyReturn) ** MonthsRemaining
-        TotalAmountInvested += MonthlySip
-        
-        if (Month + 1) % 12 == 0 and Month < TotalMonths - 1:
-            StepUpThisYear = MonthlySip * StepUpMultiplier * 12
-            TotalStepUpAmount += StepUpThisYear
-            MonthlySip *= (1 + StepUpMultiplier)
+    # (1 + MonthlyReturn) ** k for every month count, shared by all the monthly calculations below
+    PowTable = np.power(1 + MonthlyReturn, np.arange(TotalMonths + 1))
+    SipSeries = MonthlyInvestment * (1 + StepUpMultiplier) ** (np.arange(TotalMonths) // 12)
+
+    # Each month earns MonthlyReturn on the running balance, then the SIP lands:
+    # Balance[k] = PowTable[k] * (StartingLumpsum + sum of SipSeries[j] / PowTable[j + 1] for j < k)
+    Balance = PowTable * (StartingLumpsum + np.concatenate(([0.0], np.cumsum(SipSeries / PowTable[1:]))))
+    MonthlyGains = Balance[:-1] * MonthlyReturn
+    TotalInvestedSeries = StartingLumpsum + np.cumsum(SipSeries)
+    CumulativeGainsSeries = np.cumsum(MonthlyGains)
+
+    # Final Corpus counts each SIP as paid at the start of its month, i.e. one
+    # month more growth on the SIP part of the balance than the monthly table shows
+    LumpsumValue = StartingLumpsum * PowTable[-1]
+    FinalCorpus = LumpsumValue + (Balance[-1] - LumpsumValue) * (1 + MonthlyReturn)
+    TotalAmountInvested = StartingLumpsum + SipSeries.sum()
+    TotalStepUpAmount = np.diff(SipSeries[::12]).sum() * 12
 
     TotalGains = FinalCorpus - TotalAmountInvested
     RealCorpus = FinalCorpus / (1 + InflationMultiplier) ** InvestmentYears if InvestmentYears > 0 else FinalCorpus
     InflationLoss = FinalCorpus - RealCorpus
 
-    # XIRR
-    Cashflows = [-StartingLumpsum]
-    Dates = [datetime.today()]
-    CurrentSip = MonthlyInvestment
-    CurrentDate = Dates[0]
-
-    for Month in range(TotalMonths):
-        CurrentDate += timedelta(days=30.4375)
-        Dates.append(CurrentDate)
-        Cashflows.append(-CurrentSip)
-        
-        if (Month + 1) % 12 == 0 and Month < TotalMonths - 1:
-            CurrentSip *= (1 + StepUpMultiplier)
-
-    CurrentDate += timedelta(days=30.4375)
-    Dates.append(CurrentDate)
-    Cashflows.append(FinalCorpus)
+    # XIRR: lumpsum today, one SIP per month, corpus one month after the last SIP
+    Cashflows = np.empty(TotalMonths + 2)
+    Cashflows[0] = -StartingLumpsum
+    Cashflows[1:-1] = -SipSeries
+    Cashflows[-1] = FinalCorpus
+    CashflowTimes = np.arange(TotalMonths + 2) * 30.4375 / 365.25
 
-    ActualReturnXirr = CalculateReturns(Cashflows, Dates)
-    RealReturnXirr = CalculateInflationAdjustedReturns(Cashflows, Dates, InflationMultiplier)
+    ActualReturnXirr = _CalculateReturnsFromTimes(Cashflows, CashflowTimes)
+    RealReturnXirr = _CalculateInflationAdjustedReturnsFromTimes(Cashflows, CashflowTimes, InflationMultiplier)
 
     SimpleCagr = (
-        ((FinalCorpus / TotalAmountInvested) ** (1 / InvestmentYears) - 1) * 100
+        expm1(log(FinalCorpus / TotalAmountInvested) / InvestmentYears) * 100
         if TotalAmountInvested > 0 and InvestmentYears > 0 else 0
     )
 
     # Detailed Progress Tables
-    YearlyProgress = []
-    InflationAdjustedProgress = []
-    MonthlyBreakdown = []
-
-    CurrentBalance = StartingLumpsum
-    TotalInvestedSoFar = StartingLumpsum
-    CurrentSip = MonthlyInvestment
-    CumulativeGains = 0.0
+    NumYears = -(-TotalMonths // 12)
+    YearNumbers = np.arange(1, NumYears + 1)
+    YearOfMonth = np.repeat(YearNumbers, 12)[:TotalMonths]
+    MonthOfYear = np.tile(np.arange(1, 13), NumYears)[:TotalMonths]
+    IsYearEnd = MonthOfYear == 12
+    IsYearEnd[-1:] = True  # a partial final year still gets its own row
+
+    MonthlyBreakdown = pd.DataFrame({
+        "Year": YearOfMonth,
+        "Month": MonthOfYear,
+        "SIP Amount": np.round(SipSeries).astype(np.int64),
+        "Balance Before SIP": np.round(Balance[1:] - SipSeries).astype(np.int64),
+        "Monthly Gain": np.round(MonthlyGains).astype(np.int64),
+        "Balance After SIP": np.round(Balance[1:]).astype(np.int64),
+        "Total Invested So Far": np.round(TotalInvestedSeries).astype(np.int64),
+        "Total Gains So Far": np.round(CumulativeGainsSeries).astype(np.int64),
+    })
+
+    # First month in which cumulative gains overtake the amount invested
+    GainsExceedInvestment = CumulativeGainsSeries > TotalInvestedSeries
     GainsExceedInvestmentYear = None
     GainsExceedInvestmentMonth = None
-
-    for MonthNum in range(TotalMonths):
-        Year = (MonthNum // 12) + 1
-        MonthInYear = (MonthNum % 12) + 1
-        
-        MonthlyGain = CurrentBalance * MonthlyReturn
-        CurrentBalance += MonthlyGain
-        CurrentBalance += CurrentSip
-        TotalInvestedSoFar += CurrentSip
-        CumulativeGains += MonthlyGain
-
-        MonthlyBreakdown.append({
-            "Year": Year,
-            "Month": MonthInYear,
-            "SIP Amount": round(CurrentSip, 0),
-            "Balance Before SIP": round(CurrentBalance - CurrentSip, 0),
-            "Monthly Gain": round(MonthlyGain, 0),
-            "Balance After SIP": round(CurrentBalance, 0),
-            "Total Invested So Far": round(TotalInvestedSoFar, 0),
-            "Total Gains So Far": round(CumulativeGains, 0),
-        })
-
-        if CumulativeGains > TotalInvestedSoFar and GainsExceedInvestmentYear is None:
-            GainsExceedInvestmentYear = Year
-            GainsExceedInvestmentMonth = MonthInYear
-
-        if MonthInYear == 12 or MonthNum == TotalMonths - 1:
-            YearStartBalance = StartingLumpsum if Year == 1 else YearlyProgress[-1]["Balance at Year End"]
-            
-            InvestedThisYear = sum(
-                row["SIP Amount"] for row in MonthlyBreakdown if row["Year"] == Year
-            )
-            GainsThisYear = sum(
-                row["Monthly Gain"] for row in MonthlyBreakdown if row["Year"] == Year
-            )
-            
-            WealthMultiplier = CurrentBalance / TotalInvestedSoFar if TotalInvestedSoFar > 0 else 0
-            GainsToInvestmentRatio = (CurrentBalance - TotalInvestedSoFar) / TotalInvestedSoFar if TotalInvestedSoFar > 0 else 0
-            
-            if GainsToInvestmentRatio < 1:
-                WealthPhase = "📊 Building Phase"
-                PhaseDescription = "Your contributions drive growth"
-            elif GainsToInvestmentRatio < 3:
-                WealthPhase = "⚡ Acceleration Phase"
-                PhaseDescription = "Compounding kicks in"
-            else:
-                WealthPhase = "🚀 Compounding Phase"
-                PhaseDescription = "Returns drive most growth"
-
-            YearlyProgress.append({
-                "Year": Year,
-                "Starting SIP": round(MonthlyInvestment * (1 + StepUpMultiplier) ** (Year - 1), 0),  # FIXED LINE
-                "Invested This Year": round(InvestedThisYear, 0),
-                "Total Invested": round(TotalInvestedSoFar, 0),
-                "Balance at Year Start": round(YearStartBalance, 0),
-                "Gains This Year": round(GainsThisYear, 0),
-                "Balance at Year End": round(CurrentBalance, 0),
-                "Total Gains": round(CumulativeGains, 0),
-                "Wealth Multiplier": round(WealthMultiplier, 2),
-                "Gains/Investment Ratio": round(GainsToInvestmentRatio, 2),
-                "Yearly Return %": round((CurrentBalance / TotalInvestedSoFar - 1) * 100, 2) if TotalInvestedSoFar > 0 else 0,
-                "Rolling CAGR %": round(((CurrentBalance / TotalInvestedSoFar) ** (1 / Year) - 1) * 100, 2) if TotalInvestedSoFar > 0 else 0,
-                "Wealth Phase": WealthPhase,
-                "Phase Description": PhaseDescription,
-                "Compounding Milestone": "✅ Yes" if GainsExceedInvestmentYear == Year else "",
-            })
-
-            RealBalance = CurrentBalance / (1 + InflationMultiplier) ** Year if Year > 0 else CurrentBalance
-            RealInvested = TotalInvestedSoFar / (1 + InflationMultiplier) ** Year if Year > 0 else TotalInvestedSoFar
-            
-            InflationAdjustedProgress.append({
-                "Year": Year,
-                "Real Balance (Today's Value)": round(RealBalance, 0),
-                "Real Invested (Today's Value)": round(RealInvested, 0),
-                "Real Gains": round(RealBalance - RealInvested, 0),
-                "Real Wealth Multiplier": round(RealBalance / RealInvested, 2) if RealInvested > 0 else 0,
-                "Real CAGR %": round(((RealBalance / RealInvested) ** (1 / Year) - 1) * 100, 2) if RealInvested > 0 and Year > 0 else 0,
-                "Inflation Loss This Year": round(GainsThisYear * InflationMultiplier, 0),
-                "Cumulative Inflation Loss": round(CurrentBalance - RealBalance, 0),
-                "Purchasing Power vs Invested": f"{round((RealBalance / RealInvested) * 100, 0)}%" if RealInvested > 0 else "0%",
-            })
-        
-        if MonthInYear == 12 and MonthNum < TotalMonths - 1:
-            CurrentSip *= (1 + StepUpMultiplier)
+    if GainsExceedInvestment.any():
+        FirstMonth = int(np.argmax(GainsExceedInvestment))
+        GainsExceedInvestmentYear = int(YearOfMonth[FirstMonth])
+        GainsExceedInvestmentMonth = int(MonthOfYear[FirstMonth])
+
+    # Year-end rows, all years at once
+    YearEnds = np.flatnonzero(IsYearEnd)
+    YearStarts = np.arange(0, TotalMonths, 12)
+    InvestedByYear = np.add.reduceat(MonthlyBreakdown["SIP Amount"].to_numpy(), YearStarts)
+    GainsByYear = np.add.reduceat(MonthlyBreakdown["Monthly Gain"].to_numpy(), YearStarts)
+    BalanceAtYearEnd = Balance[YearEnds + 1]
+    BalanceAtYearStart = np.concatenate(([StartingLumpsum], BalanceAtYearEnd[:-1]))[:NumYears]
+    TotalInvestedByYear = TotalInvestedSeries[YearEnds]
+    TotalGainsByYear = CumulativeGainsSeries[YearEnds]
+
+    HasInvested = TotalInvestedByYear > 0
+    WealthMultipliers = np.divide(BalanceAtYearEnd, TotalInvestedByYear, out=np.zeros(NumYears), where=HasInvested)
+    GainsToInvestmentRatios = np.divide(
+        BalanceAtYearEnd - TotalInvestedByYear, TotalInvestedByYear, out=np.zeros(NumYears), where=HasInvested
+    )
+    YearlyReturns = np.where(HasInvested, (WealthMultipliers - 1) * 100, 0)
+    RollingCagrs = np.expm1(np.log(WealthMultipliers, out=np.zeros(NumYears), where=HasInvested) / YearNumbers) * 100
+
+    # Building below 1x gains/investment, accelerating below 3x, compounding beyond
+    PhaseIndex = np.searchsorted([1, 3], GainsToInvestmentRatios, side="right")
+    WealthPhases = np.array(["📊 Building Phase", "⚡ Acceleration Phase", "🚀 Compounding Phase"])[PhaseIndex]
+    PhaseDescriptions = np.array([
+        "Your contributions drive growth", "Compounding kicks in", "Returns drive most growth"
+    ])[PhaseIndex]
+    CompoundingMilestones = np.where(YearNumbers == GainsExceedInvestmentYear, "✅ Yes", "")
+
+    Deflators = (1 + InflationMultiplier) ** YearNumbers
+    RealBalances = BalanceAtYearEnd / Deflators
+    RealInvestedByYear = TotalInvestedByYear / Deflators
+    HasRealInvested = RealInvestedByYear > 0
+    RealWealthMultipliers = np.divide(RealBalances, RealInvestedByYear, out=np.zeros(NumYears), where=HasRealInvested)
+    RealCagrs = np.expm1(np.log(RealWealthMultipliers, out=np.zeros(NumYears), where=HasRealInvested) / YearNumbers) * 100
+    PurchasingPower = [
+        f"{Percent}%" if Positive else "0%"
+        for Percent, Positive in zip(np.round(RealWealthMultipliers * 100, 0), HasRealInvested)
+    ]
+
+    YearlyProgress = pd.DataFrame({
+        "Year": YearNumbers,
+        "Starting SIP": np.round(MonthlyInvestment * (1 + StepUpMultiplier) ** (YearNumbers - 1)).astype(np.int64),
+        "Invested This Year": np.round(InvestedByYear).astype(np.int64),
+        "Total Invested": np.round(TotalInvestedByYear).astype(np.int64),
+        "Balance at Year Start": np.round(BalanceAtYearStart).astype(np.int64),
+        "Gains This Year": np.round(GainsByYear).astype(np.int64),
+        "Balance at Year End": np.round(BalanceAtYearEnd).astype(np.int64),
+        "Total Gains": np.round(TotalGainsByYear).astype(np.int64),
+        "Wealth Multiplier": np.round(WealthMultipliers, 2),
+        "Gains/Investment Ratio": np.round(GainsToInvestmentRatios, 2),
+        "Yearly Return %": np.round(YearlyReturns, 2),
+        "Rolling CAGR %": np.round(RollingCagrs, 2),
+        "Wealth Phase": WealthPhases,
+        "Phase Description": PhaseDescriptions,
+        "Compounding Milestone": CompoundingMilestones,
+    })
+
+    InflationAdjustedProgress = pd.DataFrame({
+        "Year": YearNumbers,
+        "Real Balance (Today's Value)": np.round(RealBalances).astype(np.int64),
+        "Real Invested (Today's Value)": np.round(RealInvestedByYear).astype(np.int64),
+        "Real Gains": np.round(RealBalances - RealInvestedByYear).astype(np.int64),
+        "Real Wealth Multiplier": np.round(RealWealthMultipliers, 2),
+        "Real CAGR %": np.round(RealCagrs, 2),
+        "Inflation Loss This Year": np.round(GainsByYear * InflationMultiplier).astype(np.int64),
+        "Cumulative Inflation Loss": np.round(BalanceAtYearEnd - RealBalances).astype(np.int64),
+        "Purchasing Power vs Invested": PurchasingPower,
+    })
 
     # Retirement simulation
     RetirementData, YearsCorpusLasts = SimulateRetirementWithdrawals(
-        CurrentBalance,
+        Balance[-1],
         WithdrawalRateInRetirement,
         InflationRate,
         ReturnAfterRetirement
@@ -403,25 +534,50 @@ def RunSipCalculation(
     
     print("\n💾 Saving detailed results to Excel...")
 
-    # Save to Excel
-    with pd.ExcelWriter(OutputFile, engine="openpyxl") as Writer:
-        pd.DataFrame(list(Summary.items()), columns=["Metric", "Value"]).to_excel(Writer, sheet_name="📊 Summary", index=False)
-        pd.DataFrame(YearlyProgress).to_excel(Writer, sheet_name="📈 Yearly Progress", index=False)
-        pd.DataFrame(InflationAdjustedProgress).to_excel(Writer, sheet_name="💰 Real Value", index=False)
-        pd.DataFrame(MonthlyBreakdown).to_excel(Writer, sheet_name="📅 Monthly Details", index=False)
-        RetirementData.to_excel(Writer, sheet_name="🏖️ Retirement", index=False)
-
-    print(f"✅ Results saved to: {OutputFile}")
-    print("═" * 60 + "\n")
+    # Save to Excel in the background. If the caller isn't waiting for the write,
+    # the writer gets its own copies so the returned tables can be modified meanwhile
+    Tables = (Summary, YearlyProgress, InflationAdjustedProgress, MonthlyBreakdown, RetirementData)
+    if not WaitForExcel:
+        Tables = (dict(Summary),) + tuple(Table.copy() for Table in Tables[1:])
+    WriteFuture = _EXECUTOR.submit(_WriteExcel, OutputFile, *Tables)
 
-    return {
+    Results = {
         "summary": Summary,
         "yearly_progress": YearlyProgress,
         "inflation_adjusted": InflationAdjustedProgress,
         "monthly_breakdown": MonthlyBreakdown,
         "retirement_data": RetirementData,
+        "output_file": OutputFile,
+        "write_future": WriteFuture,
     }
 
+    if WaitForExcel:
+        WaitForExcelWrite(Results)
+    print("═" * 60 + "\n")
+
+    return Results
+
+
+def _WriteExcel(OutputFile, Summary, YearlyProgress, InflationAdjustedProgress, MonthlyBreakdown, RetirementData):
+    with pd.ExcelWriter(OutputFile, engine=_EXCEL_ENGINE) as Writer:
+        pd.DataFrame(list(Summary.items()), columns=["Metric", "Value"]).to_excel(Writer, sheet_name="📊 Summary", index=False)
+        YearlyProgress.to_excel(Writer, sheet_name="📈 Yearly Progress", index=False)
+        InflationAdjustedProgress.to_excel(Writer, sheet_name="💰 Real Value", index=False)
+        MonthlyBreakdown.to_excel(Writer, sheet_name="📅 Monthly Details", index=False)
+        RetirementData.to_excel(Writer, sheet_name="🏖️ Retirement", index=False)
+
+
+def WaitForExcelWrite(Results):
+    # Blocks until the Excel file from RunSipCalculation is written; re-raises write errors
+    OutputFile = Results["output_file"]
+    try:
+        Results["write_future"].result()
+    except Exception as Error:
+        print(f"❌ Could not save results to {OutputFile}: {Error}")
+        raise
+
+    print(f"✅ Results saved to: {OutputFile}")
+
 
 # ═══════════════════════════════════════════════════════════════════
 # CALCULATOR ENTRY POINTS
@@ -438,14 +594,15 @@ def SimpleSipCalculator(
     StartingLumpsum=0.0,
     WithdrawalRateInRetirement=4.0,
     ReturnAfterRetirement=7.0,
-    OutputFile="SIP_Calculator_Results.xlsx"
+    OutputFile="SIP_Calculator_Results.xlsx",
+    WaitForExcel=True
 ):
     print("\nRunning → Classic SIP Projection")
     return RunSipCalculation(
         MonthlyInvestment, ExpectedReturnPercent, InvestmentYears,
         FundExpenseRatio, YearlyStepUp, InflationRate, TaxOnGains,
         StartingLumpsum, WithdrawalRateInRetirement, ReturnAfterRetirement,
-        OutputFile, "CLASSIC SIP PROJECTION"
+        OutputFile, "CLASSIC SIP PROJECTION", WaitForExcel
     )
 
 
@@ -462,7 +619,8 @@ def GoalBaseSipCalculator(
     SolveFor="sip",
     WithdrawalRateInRetirement=4.0,
     ReturnAfterRetirement=7.0,
-    OutputFile="Goal_Based_SIP.xlsx"
+    OutputFile="Goal_Based_SIP.xlsx",
+    WaitForExcel=True
 ):
     if TargetCorpus is None or TargetCorpus <= 0:
         raise ValueError("TargetCorpus is required and must be > 0")
@@ -479,7 +637,7 @@ def GoalBaseSipCalculator(
         RequiredMonthly, ExpectedReturnPercent, InvestmentYears,
         FundExpenseRatio, YearlyStepUp, InflationRate, TaxOnGains,
         StartingLumpsum, WithdrawalRateInRetirement, ReturnAfterRetirement,
-        OutputFile, "GOAL BASED SIP CALCULATION"
+        OutputFile, "GOAL BASED SIP CALCULATION", WaitForExcel
     )
 
 
@@ -496,7 +654,8 @@ def TimeLineBaseSipCalculator(
     SolveFor="years",
     WithdrawalRateInRetirement=4.0,
     ReturnAfterRetirement=7.0,
-    OutputFile="Timeline_Planning.xlsx"
+    OutputFile="Timeline_Planning.xlsx",
+    WaitForExcel=True
 ):
     if TargetCorpus is None or TargetCorpus <= 0:
         raise ValueError("TargetCorpus is required and must be > 0")
@@ -513,7 +672,7 @@ def TimeLineBaseSipCalculator(
         MonthlyInvestment, ExpectedReturnPercent, RequiredYears,
         FundExpenseRatio, YearlyStepUp, InflationRate, TaxOnGains,
         StartingLumpsum, WithdrawalRateInRetirement, ReturnAfterRetirement,
-        OutputFile, "TIMELINE BASED SIP CALCULATION"
+        OutputFile, "TIMELINE BASED SIP CALCULATION", WaitForExcel
     )
 
 
@@ -524,8 +683,9 @@ def TimeLineBaseSipCalculator(
 if __name__ == "__main__":
     Path = r"C:\Users\Vatsal\Document\VSCodeFiles\PythonCode\FinancialCalculator\Data"
 
+    # Run all three examples while their Excel files are written, then wait for the files
     print("\n🔹 EXAMPLE 1: Basic SIP Calculation")
-    SimpleSipCalculator(
+    BasicResults = SimpleSipCalculator(
         MonthlyInvestment=10000,
         ExpectedReturnPercent=12.0,
         InvestmentYears=20,
@@ -534,10 +694,11 @@ if __name__ == "__main__":
         InflationRate=6.0,
         StartingLumpsum=50000,
         OutputFile=f"{Path}\\Basic_SIP_Example.xlsx",
+        WaitForExcel=False,
     )
 
     print("\n🔹 EXAMPLE 2: Goal Planning - Find Required SIP")
-    GoalBaseSipCalculator(
+    GoalResults = GoalBaseSipCalculator(
         MonthlyInvestment=10000,
         ExpectedReturnPercent=12.0,
         InvestmentYears=20,
@@ -546,10 +707,11 @@ if __name__ == "__main__":
         InflationRate=6.0,
         TargetCorpus=5000000,
         OutputFile=f"{Path}\\Goal_Based_SIP.xlsx",
+        WaitForExcel=False,
     )
 
     print("\n🔹 EXAMPLE 3: Goal Planning - Find Required Years")
-    TimeLineBaseSipCalculator(
+    TimelineResults = TimeLineBaseSipCalculator(
         MonthlyInvestment=10000,
         ExpectedReturnPercent=12.0,
         InvestmentYears=20,
@@ -558,4 +720,8 @@ if __name__ == "__main__":
         InflationRate=6.0,
         TargetCorpus=10000000,
         OutputFile=f"{Path}\\Timeline_Planning.xlsx",
-    )
\ No newline at end of file
+        WaitForExcel=False,
+    )
+
+    for Results in (BasicResults, GoalResults, TimelineResults):
+        WaitForExcelWrite(Results)
\ No newline at end of file